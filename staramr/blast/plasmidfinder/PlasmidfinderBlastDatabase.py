@@ -2,8 +2,6 @@ import logging
 from os import path
 from typing import List
 
-import pandas as pd
-
 from staramr.blast.AbstractBlastDatabase import AbstractBlastDatabase
 
 logger = logging.getLogger('PlasmidfinderBlastDatabase')
@@ -61,6 +59,8 @@ class PlasmidfinderBlastDatabase(AbstractBlastDatabase):
         :param database_dir: The PlasmidFinder database root directory.
         :return: A list of databases in Plasmidfinder.
         """
+        import pandas as pd
+
         config = pd.read_csv(path.join(database_dir, 'config'), sep='\t', comment='#', header=None,
                              names=['db_prefix', 'name', 'description'])
 
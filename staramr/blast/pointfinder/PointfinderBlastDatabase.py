@@ -1,7 +1,5 @@
 from os import path, listdir
 
-import pandas as pd
-
 from staramr.blast.AbstractBlastDatabase import AbstractBlastDatabase
 from staramr.blast.pointfinder.PointfinderDatabaseInfo import PointfinderDatabaseInfo
 
@@ -89,6 +87,8 @@ class PointfinderBlastDatabase(AbstractBlastDatabase):
         :param database_dir: The PointFinder database root directory.
         :return: A list of organisms.
         """
+        import pandas as pd
+
         config = pd.read_csv(path.join(database_dir, 'config'), sep='\t', comment='#', header=None,
                              names=['db_prefix', 'name', 'description'])
         return config['db_prefix'].tolist()
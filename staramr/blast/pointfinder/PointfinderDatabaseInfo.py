@@ -1,8 +1,6 @@
 import logging
 from os import path
 
-import pandas as pd
-
 """
 A Class storing information about the specific PointFinder database.
 """
@@ -31,6 +29,8 @@ class PointfinderDatabaseInfo:
         :param file: The file containing drug resistance mutations.
         :return: A new PointfinderDatabaseInfo.
         """
+        import pandas as pd
+
         pointfinder_info = pd.read_csv(file, sep='\t', index_col=False)
         return cls(pointfinder_info, file)
 
@@ -2,9 +2,6 @@ import abc
 import os
 import re
 
-from Bio.Seq import Seq
-from Bio.SeqRecord import SeqRecord
-
 from staramr.exceptions.InvalidPositionException import InvalidPositionException
 
 """
@@ -18,11 +15,15 @@ class AMRHitHSP:
         """
         Creates a new AMRHitHSP.
         :param file: The particular file this BLAST hit came from.
-        :param blast_record: The Bio.Blast.Record this hit came from.
+        :param blast_record: The BLAST tabular output values for this hit, keyed by column name.
         """
         __metaclass__ = abc.ABCMeta
         self._file = file
 
+        # Derived values, computed on first use since they are requested repeatedly while partitioning/reporting hits
+        self._genome_id = None
+        self._genome_contig_id = None
+
         if blast_record is not None:
             self._blast_record = blast_record
 
@@ -50,6 +51,13 @@ class AMRHitHSP:
         """
         return self._blast_record['length']
 
+    def get_hsp_length_total_length(self):
+        """
+        Gets the BLAST HSP length and the amr gene length, formatted as 'hsp_length/amr_gene_length'.
+        :return: The formatted HSP length and amr gene length.
+        """
+        return '{}/{}'.format(self.get_hsp_length(), self.get_amr_gene_length())
+
     def get_pid(self):
         """
         Gets the percent identity of the HSP.
@@ -91,15 +99,19 @@ class AMRHitHSP:
         Gets genome id for the file.
         :return: The genome id for the file
         """
-        return os.path.splitext(self._file)[0]
+        if self._genome_id is None:
+            self._genome_id = os.path.splitext(self._file)[0]
+        return self._genome_id
 
     def get_genome_contig_id(self):
         """
         Gets the particular id from the genome input file.
         :return: The contig id.
         """
-        re_search = re.search(r'^(\S+)', self._blast_record['sseqid'])
-        return re_search.group(1)
+        if self._genome_contig_id is None:
+            re_search = re.search(r'^(\S+)', self._blast_record['sseqid'])
+            self._genome_contig_id = re_search.group(1)
+        return self._genome_contig_id
 
     def get_genome_contig_start(self) -> int:
         """
@@ -157,22 +169,21 @@ class AMRHitHSP:
         """
         return self._blast_record['sstrand']
 
-    def get_seq_record(self):
-        """
-        Gets a SeqRecord for this hit.
-        :return: A SeqRecord for this hit.
-        """
-        return SeqRecord(Seq(self.get_genome_contig_hsp_seq()), id=self.get_amr_gene_id(),
-                         description=(
-                             'isolate: {}, contig: {}, contig_start: {}, contig_end: {}, database_gene_start: {},'
-                             ' database_gene_end: {}, hsp/length: {}/{}, pid: {:0.2f}%, plength: {:0.2f}%').format(
-                             self.get_genome_id(),
-                             self.get_genome_contig_id(),
-                             self.get_genome_contig_start(),
-                             self.get_genome_contig_end(),
-                             self.get_amr_gene_start(),
-                             self.get_amr_gene_end(),
-                             self.get_hsp_length(),
-                             self.get_amr_gene_length(),
-                             self.get_pid(),
-                             self.get_plength()))
+    def get_fasta_entry(self):
+        """
+        Gets the FASTA entry for this hit.
+        :return: A tuple of (id, description, sequence) for this hit.
+        """
+        return (self.get_amr_gene_id(),
+                ('isolate: {}, contig: {}, contig_start: {}, contig_end: {}, database_gene_start: {},'
+                 ' database_gene_end: {}, hsp/length: {}, pid: {:0.2f}%, plength: {:0.2f}%').format(
+                    self.get_genome_id(),
+                    self.get_genome_contig_id(),
+                    self.get_genome_contig_start(),
+                    self.get_genome_contig_end(),
+                    self.get_amr_gene_start(),
+                    self.get_amr_gene_end(),
+                    self.get_hsp_length_total_length(),
+                    self.get_pid(),
+                    self.get_plength()),
+                self.get_genome_contig_hsp_seq())
@@ -35,15 +35,17 @@ class BlastHitPartitions:
                 "Unsupported condition: strand=plus and contig start > contig end for hit (contig=" + hit.get_genome_contig_id() + ", start=" +
                 str(hit.get_genome_contig_start()) + ", end=" + str(hit.get_genome_contig_end()) + ")")
 
-        partition = self._get_existing_partition(hit)
+        # The strand-adjusted coordinates are computed once per hit, rather than once per partition compared against
+        start, end = self._stranded_ends(hit)
+        contig_name = hit.get_genome_contig_id()
+
+        partition = self._get_existing_partition(contig_name, start, end)
         if (partition is None):
-            self._create_new_parition(hit)
+            self._create_new_parition(hit, contig_name, start, end)
         else:
-            self._add_hit_partition(hit, partition)
-
-    def _add_hit_partition(self, hit: AMRHitHSP, partition: Dict[str, Any]) -> None:
-        start, end = self._stranded_ends(hit)
+            self._add_hit_partition(hit, start, end, partition)
 
+    def _add_hit_partition(self, hit: AMRHitHSP, start: int, end: int, partition: Dict[str, Any]) -> None:
         if start < partition['start']:
             partition['start'] = start
 
@@ -52,27 +54,21 @@ class BlastHitPartitions:
 
         partition['hits'].append(hit)
 
-    def _get_existing_partition(self, hit: AMRHitHSP) -> Optional[Dict[str, Any]]:
-        partition_name = hit.get_genome_contig_id()
-
-        if partition_name in self._partitions:
-            contig_partitions_list = self._partitions[partition_name]
+    def _get_existing_partition(self, contig_name: str, start: int, end: int) -> Optional[Dict[str, Any]]:
+        if contig_name in self._partitions:
+            contig_partitions_list = self._partitions[contig_name]
             for partition in contig_partitions_list:
-                if self._hit_in_parition(hit, partition):
+                if self._hit_in_parition(start, end, partition):
                     return partition
 
         return None
 
-    def _hit_in_parition(self, hit: AMRHitHSP, partition: Dict[str, Any]) -> bool:
+    def _hit_in_parition(self, start: int, end: int, partition: Dict[str, Any]) -> bool:
         pstart, pend = partition['start'], partition['end']
-        start, end = self._stranded_ends(hit)
 
         return (pstart < start < pend) or (pstart < end < pend) or (start <= pstart and end >= pend)
 
-    def _create_new_parition(self, hit: AMRHitHSP) -> None:
-        start, end = self._stranded_ends(hit)
-
-        contig_name = hit.get_genome_contig_id()
+    def _create_new_parition(self, hit: AMRHitHSP, contig_name: str, start: int, end: int) -> None:
         partition = {
             'start': start,
             'end': end,
@@ -97,6 +93,5 @@ class BlastHitPartitions:
         :param hit: The hit.
         :return: The (start,end) as a tuple.
         """
-        start = hit.get_genome_contig_start() if hit.get_genome_contig_strand() == 'plus' else hit.get_genome_contig_end()
-        end = hit.get_genome_contig_end() if hit.get_genome_contig_strand() == 'plus' else hit.get_genome_contig_start()
-        return start, end
+        start, end = hit.get_genome_contig_start(), hit.get_genome_contig_end()
+        return (start, end) if hit.get_genome_contig_strand() == 'plus' else (end, start)
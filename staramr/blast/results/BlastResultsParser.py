@@ -1,9 +1,12 @@
 import abc
 import logging
+import logging.handlers
+import multiprocessing
 import os
-from typing import List
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List
 
-import Bio.SeqIO
 import numpy as np
 import pandas as pd
 
@@ -12,6 +15,19 @@ from staramr.blast.results.BlastHitPartitions import BlastHitPartitions
 
 logger = logging.getLogger('BlastResultsParser')
 
+
+def _initialize_worker_logging(log_queue, log_level):
+    """
+    Sends all log records from a worker process back to the parent process, which handles them with its own handlers.
+    :param log_queue: The queue to send log records to.
+    :param log_level: The log level of the parent process.
+    :return: None
+    """
+    root_logger = logging.getLogger()
+    root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    root_logger.setLevel(log_level)
+
+
 """
 Class for parsing BLAST results.
 """
@@ -26,9 +42,29 @@ class BlastResultsParser:
     pident
     sstart
     '''.strip().split('\n')]  # type: List[str]
+    FASTA_LINE_LENGTH = 60  # type: int
+    FASTA_BUFFER_SIZE = 1048576  # type: int
+    BLAST_CHUNK_SIZE = 10000  # type: int
+    # Starting worker processes takes around a second, so only parse in parallel when there is enough BLAST output
+    PARALLEL_MIN_BLAST_BYTES = 256 * 1024 * 1024  # type: int
+    BLAST_COLUMN_TYPES = {
+        'qseqid': str,
+        'sseqid': str,
+        'pident': np.float64,
+        'length': np.int64,
+        'qstart': np.int64,
+        'qend': np.int64,
+        'sstart': np.int64,
+        'send': np.int64,
+        'slen': np.int64,
+        'qlen': np.int64,
+        'sstrand': str,
+        'sseq': str,
+        'qseq': str,
+    }  # type: Dict[str, Any]
 
     def __init__(self, file_blast_map, blast_database, pid_threshold, plength_threshold, report_all=False,
-                 output_dir=None, genes_to_exclude=[]):
+                 output_dir=None, genes_to_exclude=[], nprocs=1):
         """
         Creates a new class for parsing BLAST results.
         :param file_blast_map: A map/dictionary linking input files to BLAST results files.
@@ -38,6 +74,8 @@ class BlastResultsParser:
         :param report_all: Whether or not to report all blast hits.
         :param output_dir: The directory where output files are being written.
         :param genes_to_exclude: A list of gene IDs to exclude from the results.
+        :param nprocs: The number of processes to use for parsing BLAST results of separate input files. Only used
+                       when the BLAST results are at least PARALLEL_MIN_BLAST_BYTES in total.
         """
         __metaclass__ = abc.ABCMeta
         self._file_blast_map = file_blast_map
@@ -47,6 +85,7 @@ class BlastResultsParser:
         self._report_all = report_all
         self._output_dir = output_dir
         self._genes_to_exclude = genes_to_exclude
+        self._nprocs = nprocs
 
     def parse_results(self):
         """
@@ -54,27 +93,134 @@ class BlastResultsParser:
         :return: A pd.DataFrame containing the AMR matches from BLAST.
         """
         results = []
+        files = list(self._file_blast_map)
+
+        self._check_blast_outputs_exist()
+
+        log_queue = None
+        log_listener = None
+        executor = None
+        try:
+            # Parsing is CPU-bound, so separate processes (not threads) are used to parse input files in parallel.
+            # The ProcessPoolExecutor mp_context/initializer arguments are only available from Python 3.7.
+            if self._nprocs > 1 and len(files) > 1 and sys.version_info >= (3, 7) and \
+                    self._has_min_blast_outputs_size(self.PARALLEL_MIN_BLAST_BYTES):
+                context = multiprocessing.get_context('spawn')
+                root_logger = logging.getLogger()
+                log_queue = context.Queue()
+                executor = ProcessPoolExecutor(max_workers=min(self._nprocs, len(files)), mp_context=context,
+                                               initializer=_initialize_worker_logging,
+                                               initargs=(log_queue, root_logger.getEffectiveLevel()))
+                log_listener = logging.handlers.QueueListener(log_queue, *root_logger.handlers,
+                                                              respect_handler_level=True)
+                log_listener.start()
+                parsed_files = executor.map(self._parse_file, files)
+            else:
+                parsed_files = map(self._parse_file, files)
+
+            for file, (file_results, hit_seq_records) in zip(files, parsed_files):
+                results.extend(file_results)
+                self._write_hits(file, hit_seq_records)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            if log_listener is not None:
+                log_listener.stop()
+            if log_queue is not None:
+                log_queue.close()
+
+        return self._create_data_frame(results)
+
+    def _has_min_blast_outputs_size(self, min_size):
+        """
+        Checks whether the BLAST output files are at least a given size in total. Files are only stat()ed until
+        the total reaches min_size.
+        :param min_size: The minimum total size (in bytes).
+        :return: True if the BLAST output files total at least min_size bytes, False otherwise.
+        """
+        total_size = 0
+        for file in self._file_blast_map:
+            for blast_out in self._file_blast_map[file].values():
+                if total_size >= min_size:
+                    return True
+                total_size += os.path.getsize(blast_out)
+
+        return total_size >= min_size
+
+    def _check_blast_outputs_exist(self):
+        """
+        Checks that all BLAST output files exist before any are parsed. Each directory containing BLAST output
+        is listed once, rather than checking every file with a separate stat() call.
+        :return: None
+        """
+        directory_entries = {}  # type: Dict[str, set]
 
         for file in self._file_blast_map:
-            databases = self._file_blast_map[file]
-            hit_seq_records = []
-            for database_name, blast_out in sorted(databases.items()):
-                logger.debug(str(blast_out))
-                if (not os.path.exists(blast_out)):
+            for database_name, blast_out in sorted(self._file_blast_map[file].items()):
+                directory, name = os.path.split(blast_out)
+                if directory not in directory_entries:
+                    try:
+                        with os.scandir(directory or os.curdir) as entries:
+                            directory_entries[directory] = {entry.name for entry in entries}
+                    except OSError:
+                        directory_entries[directory] = set()
+
+                if name not in directory_entries[directory]:
                     raise Exception("Blast output [" + blast_out + "] does not exist")
-                self._handle_blast_hit(file, database_name, blast_out, results, hit_seq_records)
 
-            if self._output_dir:
-                out_file = self._get_out_file_name(file)
-                if hit_seq_records:
-                    logger.debug("Writting hits to %s", out_file)
-                    Bio.SeqIO.write(hit_seq_records, out_file, 'fasta')
-                else:
-                    logger.debug("No hits found, skipping writing output file to %s", out_file)
+    def _parse_file(self, file):
+        """
+        Parses the BLAST results for a single input file.
+        :param file: The input file name.
+        :return: A tuple of (result rows, hit sequence records) for the input file.
+        """
+        results = []
+        hit_seq_records = []
+
+        for database_name, blast_out in sorted(self._file_blast_map[file].items()):
+            logger.debug("Parsing BLAST output [%s]", blast_out)
+            self._handle_blast_hit(file, database_name, blast_out, results, hit_seq_records)
+
+        return results, hit_seq_records
+
+    def _write_hits(self, file, hit_seq_records):
+        """
+        Writes the hit sequences for an input file, if an output directory is defined.
+        :param file: The input file name.
+        :param hit_seq_records: A list of (id, description, sequence) tuples.
+        :return: None
+        """
+        if self._output_dir:
+            out_file = self._get_out_file_name(file)
+            if hit_seq_records:
+                logger.debug("Writting hits to %s", out_file)
+                self._write_fasta(out_file, hit_seq_records)
             else:
-                logger.debug("No output directory defined for blast hits, skipping writing file")
+                logger.debug("No hits found, skipping writing output file to %s", out_file)
+        else:
+            logger.debug("No output directory defined for blast hits, skipping writing file")
 
-        return pd.DataFrame(results, columns=self.COLUMNS).sort_values(by=self.SORT_COLUMNS).set_index(self.INDEX)
+    def _create_data_frame(self, results):
+        """
+        Builds the results pd.DataFrame in a single step from all accumulated result rows.
+        :param results: A list of result rows (lists of values ordered as in COLUMNS).
+        :return: A pd.DataFrame of the results, sorted by SORT_COLUMNS and indexed by INDEX.
+        """
+        return pd.DataFrame.from_records(results, columns=self.COLUMNS).sort_values(by=self.SORT_COLUMNS).set_index(
+            self.INDEX)
+
+    def _write_fasta(self, out_file, hit_seq_records):
+        """
+        Writes hit sequences to a FASTA file.
+        :param out_file: The output file name.
+        :param hit_seq_records: A list of (id, description, sequence) tuples.
+        :return: None
+        """
+        line_length = self.FASTA_LINE_LENGTH
+        with open(out_file, 'w', buffering=self.FASTA_BUFFER_SIZE) as fh:
+            for seq_id, description, seq in hit_seq_records:
+                fh.write('>' + seq_id + ' ' + description + '\n')
+                fh.write('\n'.join(seq[i:i + line_length] for i in range(0, len(seq), line_length)) + '\n')
 
     @abc.abstractmethod
     def _get_out_file_name(self, in_file):
@@ -85,18 +231,45 @@ class BlastResultsParser:
         """
         pass
 
+    def _read_blast_table(self, blast_file):
+        """
+        Reads a BLAST tabular results file, keeping only the HSPs which pass the thresholds.
+        The file is streamed in chunks so HSPs failing the thresholds are discarded as they are read.
+        :param blast_file: The BLAST results file.
+        :return: A pd.DataFrame of the HSPs passing the thresholds, with an additional 'plength' column.
+        """
+        filtered_tables = []
+        for blast_table in pd.read_csv(blast_file, sep='\t', header=None, names=JobHandler.BLAST_COLUMNS,
+                                       index_col=False, dtype=self.BLAST_COLUMN_TYPES, na_filter=False,
+                                       chunksize=self.BLAST_CHUNK_SIZE):
+            blast_table['plength'] = (blast_table.length / blast_table.qlen) * 100.0
+            filtered_tables.append(blast_table[
+                (blast_table.pident >= self._pid_threshold) & (blast_table.plength >= self._plength_threshold) &
+                ~blast_table.qseqid.isin(self._genes_to_exclude)])
+
+        if not filtered_tables:
+            return pd.DataFrame(columns=JobHandler.BLAST_COLUMNS + ['plength'])
+
+        return pd.concat(filtered_tables, ignore_index=True)
+
+    def _iter_blast_records(self, blast_table):
+        """
+        Iterates over the rows of a BLAST table as dictionaries. Rows are converted a batch of BLAST_CHUNK_SIZE rows
+        at a time, with each column of a batch converted to Python values in one step rather than value by value.
+        :param blast_table: The pd.DataFrame of BLAST results.
+        :return: A generator of dictionaries mapping BLAST column names to values, one per row.
+        """
+        columns = list(blast_table.columns)
+        for batch_start in range(0, len(blast_table), self.BLAST_CHUNK_SIZE):
+            batch = blast_table.iloc[batch_start:batch_start + self.BLAST_CHUNK_SIZE]
+            for row in zip(*[batch[column].tolist() for column in columns]):
+                yield dict(zip(columns, row))
+
     def _handle_blast_hit(self, in_file, database_name, blast_file, results, hit_seq_records):
-        blast_table = pd.read_csv(blast_file, sep='\t', header=None, names=JobHandler.BLAST_COLUMNS,
-                                  index_col=False).astype(
-            dtype={'qseqid': np.unicode_, 'sseqid': np.unicode_})
+        blast_table = self._read_blast_table(blast_file).sort_values(by=self.BLAST_SORT_COLUMNS)
         partitions = BlastHitPartitions()
 
-        blast_table['plength'] = (blast_table.length / blast_table.qlen) * 100.0
-        blast_table = blast_table[
-            (blast_table.pident >= self._pid_threshold) & (blast_table.plength >= self._plength_threshold) &
-            ~blast_table.qseqid.isin(self._genes_to_exclude)]
-        blast_table.sort_values(by=self.BLAST_SORT_COLUMNS, inplace=True)
-        for index, blast_record in blast_table.iterrows():
+        for blast_record in self._iter_blast_records(blast_table):
             partitions.append(self._create_hit(in_file, database_name, blast_record))
 
         for hits_non_overlapping in partitions.get_hits_nonoverlapping_regions():
@@ -105,22 +278,28 @@ class BlastResultsParser:
                 if blast_results is not None:
                     logger.debug("record = %s", blast_results)
                     results.extend(blast_results)
-                    hit_seq_records.append(hit.get_seq_record())
+                    # Hit sequences are only needed when they will be written out
+                    if self._output_dir:
+                        hit_seq_records.append(hit.get_fasta_entry())
 
     def _select_hits_to_include(self, hits):
         hits_to_include = []
 
         if len(hits) >= 1:
-            sorted_hits_pid_first = sorted(hits, key=lambda x: (
-                x.get_pid(), x.get_plength(), x.get_amr_gene_length(), x.get_amr_gene_id()), reverse=True)
-            sorted_hits_length_first = sorted(hits, key=lambda x: (
-                x.get_amr_gene_length(), x.get_pid(), x.get_plength(), x.get_amr_gene_id()), reverse=True)
+            # Look up the values used to order hits once per hit, rather than once per ordering
+            pid_first_keys = [(x.get_pid(), x.get_plength(), x.get_amr_gene_length(), x.get_amr_gene_id()) for x in
+                              hits]
+            indices = range(len(hits))
 
             if self._report_all:
-                hits_to_include = sorted_hits_pid_first
+                hits_to_include = [hits[i] for i in sorted(indices, key=pid_first_keys.__getitem__, reverse=True)]
             else:
-                first_hit_pid = sorted_hits_pid_first[0]
-                first_hit_length = sorted_hits_length_first[0]
+                length_first_keys = [(length, pid, plength, gene_id) for pid, plength, length, gene_id in
+                                     pid_first_keys]
+
+                # max() returns the first of any tied hits, the same hit a stable descending sort would place first
+                first_hit_pid = hits[max(indices, key=pid_first_keys.__getitem__)]
+                first_hit_length = hits[max(indices, key=length_first_keys.__getitem__)]
 
                 if first_hit_pid == first_hit_length:
                     hits_to_include.append(first_hit_length)
@@ -137,8 +316,22 @@ class BlastResultsParser:
 
     @abc.abstractmethod
     def _create_hit(self, file, database_name, blast_record):
+        """
+        Creates a hit for a single BLAST record.
+        :param file: The input file name.
+        :param database_name: The name of the database the hit came from.
+        :param blast_record: A dictionary of the BLAST tabular output values for the hit, keyed by column name.
+        :return: The hit.
+        """
         pass
 
     @abc.abstractmethod
     def _get_result_rows(self, hit, database_name):
+        """
+        Gets the result rows for a hit. Rows are accumulated across all files and only converted into a
+        pd.DataFrame once all files are parsed, so implementations should return plain lists of values.
+        :param hit: The hit.
+        :param database_name: The name of the database the hit came from.
+        :return: A list of rows (lists of values ordered as in COLUMNS), or None if there are no results.
+        """
         pass
@@ -1,7 +1,5 @@
 from os import path
-from typing import Dict, List, Optional
-
-import pandas as pd
+from typing import Any, Dict, List, Optional
 
 from staramr.blast.plasmidfinder.PlasmidfinderBlastDatabase import PlasmidfinderBlastDatabase
 from staramr.blast.results.BlastResultsParser import BlastResultsParser
@@ -29,7 +27,7 @@ class BlastResultsParserPlasmidfinder(BlastResultsParser):
     def __init__(self, file_blast_map: Dict[str, BlastResultsParser],
                  blast_database: Optional[PlasmidfinderBlastDatabase], pid_threshold: float, plength_threshold: float,
                  report_all: bool = False,
-                 output_dir: str = None, genes_to_exclude: List[str] = []) -> None:
+                 output_dir: str = None, genes_to_exclude: List[str] = [], nprocs: int = 1) -> None:
         """
         Creates a new BlastResultsParserPlasmidfinder.
         :param file_blast_map: A map/dictionary linking input files to BLAST results files.
@@ -39,11 +37,12 @@ class BlastResultsParserPlasmidfinder(BlastResultsParser):
         :param report_all: Whether or not to report all blast hits.
         :param output_dir: The directory where output files are being written.
         :param genes_to_exclude: A list of gene IDs to exclude from the results.
+        :param nprocs: The number of processes to use for parsing BLAST results of separate input files.
         """
         super().__init__(file_blast_map, blast_database, pid_threshold, plength_threshold, report_all,
-                         output_dir=output_dir, genes_to_exclude=genes_to_exclude)
+                         output_dir=output_dir, genes_to_exclude=genes_to_exclude, nprocs=nprocs)
 
-    def _create_hit(self, file: str, database_name: str, blast_record: pd.Series) -> PlasmidfinderHitHSP:
+    def _create_hit(self, file: str, database_name: str, blast_record: Dict[str, Any]) -> PlasmidfinderHitHSP:
         return PlasmidfinderHitHSP(file, blast_record)
 
     def _get_result_rows(self, hit: PlasmidfinderHitHSP, database_name: str) -> list:
@@ -51,7 +50,7 @@ class BlastResultsParserPlasmidfinder(BlastResultsParser):
                  hit.get_amr_gene_name(),
                  hit.get_pid(),
                  hit.get_plength(),
-                 str(hit.get_hsp_length()) + "/" + str(hit.get_amr_gene_length()),
+                 hit.get_hsp_length_total_length(),
                  hit.get_genome_contig_id(),
                  hit.get_genome_contig_start(),
                  hit.get_genome_contig_end(),
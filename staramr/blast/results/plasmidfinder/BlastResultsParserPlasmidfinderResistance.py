@@ -26,7 +26,7 @@ class BlastResultsParserPlasmidfinderResistance(BlastResultsParserPlasmidfinder)
 
     def __init__(self, file_blast_map: Dict[str, BlastResultsParser], blast_database: PlasmidfinderBlastDatabase,
                  pid_threshold: float, plength_threshold: float,
-                 report_all: bool = False, output_dir: str = None, genes_to_exclude: List[str] = []) -> None:
+                 report_all: bool = False, output_dir: str = None, genes_to_exclude: List[str] = [], nprocs: int = 1) -> None:
         """
         Creates a new BlastResultsParserPlasmidfinderResistance.
         :param file_blast_map: A map/dictionary linking input files to BLAST results files.
@@ -36,16 +36,17 @@ class BlastResultsParserPlasmidfinderResistance(BlastResultsParserPlasmidfinder)
         :param report_all: Whether or not to report all blast hits.
         :param output_dir: The directory where output files are being written.
         :param genes_to_exclude: A list of gene IDs to exclude from the results.
+        :param nprocs: The number of processes to use for parsing BLAST results of separate input files.
         """
         super().__init__(file_blast_map, blast_database, pid_threshold, plength_threshold, report_all,
-                         output_dir=output_dir, genes_to_exclude=genes_to_exclude)
+                         output_dir=output_dir, genes_to_exclude=genes_to_exclude, nprocs=nprocs)
 
     def _get_result_rows(self, hit: PlasmidfinderHitHSP, database_name: str) -> list:
         return [[hit.get_genome_id(),
                  hit.get_amr_gene_name(),
                  hit.get_pid(),
                  hit.get_plength(),
-                 str(hit.get_hsp_length()) + "/" + str(hit.get_amr_gene_length()),
+                 hit.get_hsp_length_total_length(),
                  hit.get_genome_contig_id(),
                  hit.get_genome_contig_start(),
                  hit.get_genome_contig_end(),
@@ -1,8 +1,6 @@
 import logging
 import re
-from typing import List
-
-import pandas as pd
+from typing import Any, Dict, List
 
 from staramr.blast.results.AMRHitHSP import AMRHitHSP
 
@@ -15,13 +13,11 @@ A Class storing a PlasmidFinder-specific BLAST hit/HSP.
 
 class PlasmidfinderHitHSP(AMRHitHSP):
 
-    def __init__(self, file: str, blast_record: pd.Series) -> None:
+    def __init__(self, file: str, blast_record: Dict[str, Any]) -> None:
         """
         Builds a new PlasmidfinderHitHSP.
         :param file: The input file.
-        :param blast_record: The Bio.Blast.Record this hit came from.
-        :param hit: The particular Bio.Blast.Record.Alignment.
-        :param hsp: The particular Bio.Blast.Record.HSP.
+        :param blast_record: The BLAST tabular output values for this hit, keyed by column name.
         """
         super().__init__(file, blast_record)
 
@@ -29,7 +29,7 @@ class BlastResultsParserPointfinder(BlastResultsParser):
     SORT_COLUMNS = ['Isolate ID', 'Gene']
 
     def __init__(self, file_blast_map, blast_database, pid_threshold, plength_threshold, report_all=False,
-                 output_dir=None, genes_to_exclude=[]):
+                 output_dir=None, genes_to_exclude=[], nprocs=1):
         """
         Creates a new BlastResultsParserPointfinder.
         :param file_blast_map: A map/dictionary linking input files to BLAST results files.
@@ -39,9 +39,10 @@ class BlastResultsParserPointfinder(BlastResultsParser):
         :param report_all: Whether or not to report all blast hits.
         :param output_dir: The directory where output files are being written.
         :param genes_to_exclude: A list of gene IDs to exclude from the results.
+        :param nprocs: The number of processes to use for parsing BLAST results of separate input files.
         """
         super().__init__(file_blast_map, blast_database, pid_threshold, plength_threshold, report_all,
-                         output_dir=output_dir, genes_to_exclude=genes_to_exclude)
+                         output_dir=output_dir, genes_to_exclude=genes_to_exclude, nprocs=nprocs)
 
     def _create_hit(self, file, database_name, blast_record):
         logger.debug("database_name=%s", database_name)
@@ -50,28 +51,38 @@ class BlastResultsParserPointfinder(BlastResultsParser):
         else:
             return PointfinderHitHSP(file, blast_record)
 
-    def _get_result(self, hit, db_mutation):
-        return [hit.get_genome_id(),
-                hit.get_amr_gene_id() + " (" + db_mutation.get_mutation_string_short() + ")",
-                db_mutation.get_type(),
-                db_mutation.get_mutation_position(),
-                db_mutation.get_mutation_string(),
-                hit.get_pid(),
+    def _get_hit_result_values(self, hit):
+        """
+        Gets the values for the result columns which come from the hit alone, and so are the same for every mutation.
+        :param hit: The hit.
+        :return: A list of the hit values, ordered as in the trailing columns of COLUMNS.
+        """
+        return [hit.get_pid(),
                 hit.get_plength(),
-                str(hit.get_hsp_length()) + "/" + str(hit.get_amr_gene_length()),
+                hit.get_hsp_length_total_length(),
                 hit.get_genome_contig_id(),
                 hit.get_genome_contig_start(),
                 hit.get_genome_contig_end()
                 ]
 
+    def _get_result(self, hit, db_mutation, hit_result_values):
+        return [hit.get_genome_id(),
+                hit.get_amr_gene_id() + " (" + db_mutation.get_mutation_string_short() + ")",
+                db_mutation.get_type(),
+                db_mutation.get_mutation_position(),
+                db_mutation.get_mutation_string()
+                ] + hit_result_values
+
     def _get_result_rows(self, hit, database_name):
         database_mutations = hit.get_mutations()
 
         gene = hit.get_amr_gene_name()
 
-        for x in database_mutations:
-            logger.debug("database_mutations: position=%s, mutation=%s", x.get_mutation_position(),
-                         x.get_mutation_string())
+        # Only walk the mutations for logging when debug output is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            for x in database_mutations:
+                logger.debug("database_mutations: position=%s, mutation=%s", x.get_mutation_position(),
+                             x.get_mutation_string())
 
         if (database_name == '16S_rrsD') or (database_name == '23S'):
             database_resistance_mutations = self._blast_database.get_resistance_nucleotides(gene, database_mutations)
@@ -83,10 +94,11 @@ class BlastResultsParserPointfinder(BlastResultsParser):
             logger.debug("No mutations for id=[%s], file=[%s]", hit.get_amr_gene_id(), hit.get_file())
         else:
             results = []
+            hit_result_values = self._get_hit_result_values(hit)
             for db_mutation in database_resistance_mutations:
                 logger.debug("multiple resistance mutations for [%s]: mutations=[%s], file=[%s]",
                              hit.get_amr_gene_id(), database_resistance_mutations, hit.get_file())
-                results.append(self._get_result(hit, db_mutation))
+                results.append(self._get_result(hit, db_mutation, hit_result_values))
 
             return results
 
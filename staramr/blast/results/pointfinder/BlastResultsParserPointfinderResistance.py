@@ -26,7 +26,7 @@ class BlastResultsParserPointfinderResistance(BlastResultsParserPointfinder):
     '''.strip().split('\n')]
 
     def __init__(self, file_blast_map, arg_drug_table, blast_database, pid_threshold, plength_threshold,
-                 report_all=False, output_dir=None, genes_to_exclude=[]):
+                 report_all=False, output_dir=None, genes_to_exclude=[], nprocs=1):
         """
         Creates a new BlastResultsParserPointfinderResistance.
         :param file_blast_map: A map/dictionary linking input files to BLAST results files.
@@ -37,12 +37,13 @@ class BlastResultsParserPointfinderResistance(BlastResultsParserPointfinder):
         :param report_all: Whether or not to report all blast hits.
         :param output_dir: The directory where output files are being written.
         :param genes_to_exclude: A list of gene IDs to exclude from the results.
+        :param nprocs: The number of processes to use for parsing BLAST results of separate input files.
         """
         super().__init__(file_blast_map, blast_database, pid_threshold, plength_threshold, report_all,
-                         output_dir=output_dir, genes_to_exclude=genes_to_exclude)
+                         output_dir=output_dir, genes_to_exclude=genes_to_exclude, nprocs=nprocs)
         self._arg_drug_table = arg_drug_table
 
-    def _get_result(self, hit, db_mutation):
+    def _get_result(self, hit, db_mutation, hit_result_values):
         drug = self._arg_drug_table.get_drug(self._blast_database.get_organism(), hit.get_amr_gene_id(),
                                              db_mutation.get_mutation_position())
         gene_name = hit.get_amr_gene_id() + " (" + db_mutation.get_mutation_string_short() + ")"
@@ -55,11 +56,5 @@ class BlastResultsParserPointfinderResistance(BlastResultsParserPointfinder):
                 drug,
                 db_mutation.get_type(),
                 db_mutation.get_mutation_position(),
-                db_mutation.get_mutation_string(),
-                hit.get_pid(),
-                hit.get_plength(),
-                str(hit.get_hsp_length()) + "/" + str(hit.get_amr_gene_length()),
-                hit.get_genome_contig_id(),
-                hit.get_genome_contig_start(),
-                hit.get_genome_contig_end()
-                ]
+                db_mutation.get_mutation_string()
+                ] + hit_result_values
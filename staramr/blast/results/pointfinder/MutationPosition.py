@@ -6,6 +6,8 @@ A Class defining a nucleotide-based mutation for PointFinder.
 
 
 class MutationPosition:
+    # Mutation positions are created for every mismatch in every PointFinder hit, so avoid a per-instance __dict__
+    __slots__ = ('_database_amr_gene_start', '_nucleotide_position_amr_gene')
 
     def __init__(self, match_position, database_amr_gene_start):
         """
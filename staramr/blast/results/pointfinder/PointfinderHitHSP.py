@@ -16,7 +16,7 @@ class PointfinderHitHSP(AMRHitHSP):
         """
         Creates a new PointfinderHitHSP.
         :param file: The input file.
-        :param blast_record: The Bio.Blast.Record this hit came from.
+        :param blast_record: The BLAST tabular output values for this hit, keyed by column name.
         """
         super().__init__(file, blast_record)
 
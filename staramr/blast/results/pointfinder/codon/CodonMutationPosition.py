@@ -10,6 +10,7 @@ A Class defining a codon-based mutation for PointFinder.
 
 
 class CodonMutationPosition(MutationPosition):
+    __slots__ = ('_codon_start', '_database_amr_gene_codon', '_input_genome_codon')
 
     def __init__(self, match_position, database_amr_gene_string, input_genome_blast_string, database_amr_gene_start):
         """
@@ -97,6 +98,6 @@ class CodonMutationPosition(MutationPosition):
 
     def __repr__(self):
         return (
-            'CodonMutationPosition(_database_amr_gene_start={_database_amr_gene_start}, _nucleotide_position_amr_gene={_nucleotide_position_amr_gene}, '
-            '_codon_start={_codon_start}, _database_amr_gene_codon={_database_amr_gene_codon}, _input_genome_codon={_input_genome_codon})').format(
-            **self.__dict__)
+            'CodonMutationPosition(_database_amr_gene_start={0._database_amr_gene_start}, _nucleotide_position_amr_gene={0._nucleotide_position_amr_gene}, '
+            '_codon_start={0._codon_start}, _database_amr_gene_codon={0._database_amr_gene_codon}, _input_genome_codon={0._input_genome_codon})').format(
+            self)
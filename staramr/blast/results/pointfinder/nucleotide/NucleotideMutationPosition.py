@@ -6,6 +6,7 @@ A Class defining a nucleotide-based mutation for PointFinder.
 
 
 class NucleotideMutationPosition(MutationPosition):
+    __slots__ = ('_database_amr_gene_mutation', '_input_genome_mutation')
 
     def __init__(self, match_position, database_amr_gene_string, input_genome_string, database_amr_gene_start):
         """
@@ -37,6 +38,6 @@ class NucleotideMutationPosition(MutationPosition):
 
     def __repr__(self):
         return (
-            'NucleotideMutationPosition(_database_amr_gene_start={_database_amr_gene_start}, _nucleotide_position_amr_gene={_nucleotide_position_amr_gene}, '
-            '_database_amr_gene_mutation={_database_amr_gene_mutation}, _input_genome_mutation={_input_genome_mutation})').format(
-            **self.__dict__)
+            'NucleotideMutationPosition(_database_amr_gene_start={0._database_amr_gene_start}, _nucleotide_position_amr_gene={0._nucleotide_position_amr_gene}, '
+            '_database_amr_gene_mutation={0._database_amr_gene_mutation}, _input_genome_mutation={0._input_genome_mutation})').format(
+            self)
@@ -8,7 +8,7 @@ class PointfinderHitHSPRNA(PointfinderHitHSP):
         """
         Creates a new PointfinderHitHSPRNA.
         :param file: The input file.
-        :param blast_record: The Bio.Blast.Record this hit came from.
+        :param blast_record: The BLAST tabular output values for this hit, keyed by column name.
         """
         super().__init__(file, blast_record)
 
@@ -21,7 +21,7 @@ class BlastResultsParserResfinderResistance(BlastResultsParserResfinder):
     '''.strip().split('\n')]
 
     def __init__(self, file_blast_map, arg_drug_table, blast_database, pid_threshold, plength_threshold,
-                 report_all=False, output_dir=None, genes_to_exclude=[]):
+                 report_all=False, output_dir=None, genes_to_exclude=[], nprocs=1):
         """
         Creates a new BlastResultsParserResfinderResistance.
         :param file_blast_map: A map/dictionary linking input files to BLAST results files.
@@ -32,9 +32,10 @@ class BlastResultsParserResfinderResistance(BlastResultsParserResfinder):
         :param report_all: Whether or not to report all blast hits.
         :param output_dir: The directory where output files are being written.
         :param genes_to_exclude: A list of gene IDs to exclude from the results.
+        :param nprocs: The number of processes to use for parsing BLAST results of separate input files.
         """
         super().__init__(file_blast_map, blast_database, pid_threshold, plength_threshold, report_all,
-                         output_dir=output_dir, genes_to_exclude=genes_to_exclude)
+                         output_dir=output_dir, genes_to_exclude=genes_to_exclude, nprocs=nprocs)
         self._arg_drug_table = arg_drug_table
 
     def _get_result_rows(self, hit, database_name):
@@ -49,7 +50,7 @@ class BlastResultsParserResfinderResistance(BlastResultsParserResfinder):
                  drug,
                  hit.get_pid(),
                  hit.get_plength(),
-                 str(hit.get_hsp_length()) + "/" + str(hit.get_amr_gene_length()),
+                 hit.get_hsp_length_total_length(),
                  hit.get_genome_contig_id(),
                  hit.get_genome_contig_start(),
                  hit.get_genome_contig_end(),
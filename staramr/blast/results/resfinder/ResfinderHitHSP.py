@@ -16,9 +16,7 @@ class ResfinderHitHSP(AMRHitHSP):
         """
         Builds a new ResfinderHitHSP.
         :param file: The input file.
-        :param blast_record: The Bio.Blast.Record this hit came from.
-        :param hit: The particular Bio.Blast.Record.Alignment.
-        :param hsp: The particular Bio.Blast.Record.HSP.
+        :param blast_record: The BLAST tabular output values for this hit, keyed by column name.
         """
         super().__init__(file, blast_record)
 
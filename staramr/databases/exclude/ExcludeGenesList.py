@@ -1,7 +1,5 @@
 from os import path
 
-import pandas as pd
-
 """
 A Class used to parse out a list of genes to exclude from the results.
 """
@@ -11,6 +9,8 @@ class ExcludeGenesList:
     DEFAULT_EXCLUDE_FILE = path.join(path.dirname(__file__), 'data', 'genes_to_exclude.tsv')
 
     def __init__(self, file=DEFAULT_EXCLUDE_FILE):
+        import pandas as pd
+
         self._data = pd.read_csv(file, sep='\t')
 
     def tolist(self):
@@ -32,7 +32,7 @@ class AMRDetection:
     def __init__(self, resfinder_database: ResfinderBlastDatabase, amr_detection_handler,
                  pointfinder_database: PointfinderBlastDatabase = None,
                  include_negative_results: bool = False, output_dir: str = None, genes_to_exclude: list = [],
-                 plasmidfinder_database: PlasmidfinderBlastDatabase = None) -> None:
+                 plasmidfinder_database: PlasmidfinderBlastDatabase = None, nprocs: int = 1) -> None:
         """
         Builds a new AMRDetection object.
         :param resfinder_database: The staramr.blast.resfinder.ResfinderBlastDatabase for the particular ResFinder database.
@@ -42,6 +42,7 @@ class AMRDetection:
         :param include_negative_results:  If True, include files lacking AMR genes in the resulting summary table.
         :param output_dir: The directory where output fasta files are to be written into (None for no output fasta files).
         :param genes_to_exclude: A list of gene IDs to exclude from the results.
+        :param nprocs: The number of processes to use for parsing BLAST results.
         """
         self._resfinder_database = resfinder_database
         self._amr_detection_handler = amr_detection_handler
@@ -57,6 +58,7 @@ class AMRDetection:
         self._output_dir = output_dir
 
         self._genes_to_exclude = genes_to_exclude
+        self._nprocs = nprocs
 
     def _create_amr_summary(self, files: List[str], resfinder_dataframe: DataFrame,quality_module_dataframe: DataFrame,
                             pointfinder_dataframe: Optional[BlastResultsParserPointfinder],
@@ -76,7 +78,7 @@ class AMRDetection:
                                     report_all: bool) -> DataFrame:
         resfinder_parser = BlastResultsParserResfinder(resfinder_blast_map, self._resfinder_database, pid_threshold,
                                                        plength_threshold, report_all, output_dir=self._output_dir,
-                                                       genes_to_exclude=self._genes_to_exclude)
+                                                       genes_to_exclude=self._genes_to_exclude, nprocs=self._nprocs)
         return resfinder_parser.parse_results()
 
     def _create_pointfinder_dataframe(self, pointfinder_blast_map: Dict, pid_threshold: float, plength_threshold: int,
@@ -84,7 +86,7 @@ class AMRDetection:
         pointfinder_parser = BlastResultsParserPointfinder(pointfinder_blast_map, self._pointfinder_database,
                                                            pid_threshold, plength_threshold, report_all,
                                                            output_dir=self._output_dir,
-                                                           genes_to_exclude=self._genes_to_exclude)
+                                                           genes_to_exclude=self._genes_to_exclude, nprocs=self._nprocs)
         return pointfinder_parser.parse_results()
 
     def _create_plasmidfinder_dataframe(self, plasmidfinder_blast_map: Dict[str, BlastResultsParser],
@@ -94,7 +96,8 @@ class AMRDetection:
                                                                pid_threshold,
                                                                plength_threshold, report_all,
                                                                output_dir=self._output_dir,
-                                                               genes_to_exclude=self._genes_to_exclude)
+                                                               genes_to_exclude=self._genes_to_exclude,
+                                                               nprocs=self._nprocs)
         return plasmidfinder_parser.parse_results()
 
     def create_quality_module_dataframe(self,files,genome_size_lower_bound,genome_size_upper_bound,minimum_N50_value,
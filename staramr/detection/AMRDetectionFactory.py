@@ -14,7 +14,7 @@ class AMRDetectionFactory:
         pass
 
     def build(self, plasmidfinder_database, resfinder_database, blast_handler, pointfinder_database, include_negatives,
-              include_resistances=False, output_dir=None, genes_to_exclude=[]):
+              include_resistances=False, output_dir=None, genes_to_exclude=[], nprocs=1):
         """
         Builds a new AMRDetection object.
         :param plasmidfinder_database: The staramr.blast.plasmidfinder.PlasmidfinderBlastDatabase to use for the particular PlasmidFinder database.
@@ -25,6 +25,7 @@ class AMRDetectionFactory:
         :param include_resistances: If True, include predicted drug resistances in output.
         :param output_dir: The directory where output files are being written.
         :param genes_to_exclude: A list of gene IDs to exclude from the results.
+        :param nprocs: The number of processes to use for parsing BLAST results.
         :return: A new AMRDetection object.
         """
 
@@ -32,8 +33,8 @@ class AMRDetectionFactory:
             return AMRDetectionResistance(resfinder_database, ARGDrugTableResfinder(), blast_handler,
                                           ARGDrugTablePointfinder(), pointfinder_database, include_negatives,
                                           output_dir=output_dir, genes_to_exclude=genes_to_exclude,
-                                          plasmidfinder_database=plasmidfinder_database)
+                                          plasmidfinder_database=plasmidfinder_database, nprocs=nprocs)
         else:
             return AMRDetection(resfinder_database, blast_handler, pointfinder_database, include_negatives,
                                 output_dir=output_dir, genes_to_exclude=genes_to_exclude,
-                                plasmidfinder_database=plasmidfinder_database)
+                                plasmidfinder_database=plasmidfinder_database, nprocs=nprocs)
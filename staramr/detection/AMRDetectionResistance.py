@@ -20,7 +20,7 @@ class AMRDetectionResistance(AMRDetection):
 
     def __init__(self, resfinder_database, arg_drug_table_resfinder, amr_detection_handler, arg_drug_table_pointfinder,
                  pointfinder_database=None, include_negative_results=False, output_dir=None, genes_to_exclude=[],
-                 plasmidfinder_database=None):
+                 plasmidfinder_database=None, nprocs=1):
         """
         Builds a new AMRDetectionResistance.
         :param resfinder_database: The staramr.blast.resfinder.ResfinderBlastDatabase for the particular ResFinder database.
@@ -31,10 +31,11 @@ class AMRDetectionResistance(AMRDetection):
         :param include_negative_results:  If True, include files lacking AMR genes in the resulting summary table.
         :param output_dir: The directory where output fasta files are to be written into (None for no output fasta files).
         :param genes_to_exclude: A list of gene IDs to exclude from the results.
+        :param nprocs: The number of processes to use for parsing BLAST results.
         """
         super().__init__(resfinder_database, amr_detection_handler, pointfinder_database, include_negative_results,
                          output_dir=output_dir, genes_to_exclude=genes_to_exclude,
-                         plasmidfinder_database=plasmidfinder_database)
+                         plasmidfinder_database=plasmidfinder_database, nprocs=nprocs)
         self._arg_drug_table_resfinder = arg_drug_table_resfinder
         self._arg_drug_table_pointfinder = arg_drug_table_pointfinder
 
@@ -43,7 +44,8 @@ class AMRDetectionResistance(AMRDetection):
                                                                  self._resfinder_database, pid_threshold,
                                                                  plength_threshold, report_all,
                                                                  output_dir=self._output_dir,
-                                                                 genes_to_exclude=self._genes_to_exclude)
+                                                                 genes_to_exclude=self._genes_to_exclude,
+                                                                 nprocs=self._nprocs)
         return resfinder_parser.parse_results()
 
     def _create_pointfinder_dataframe(self, pointfinder_blast_map, pid_threshold, plength_threshold, report_all):
@@ -52,7 +54,8 @@ class AMRDetectionResistance(AMRDetection):
                                                                      self._pointfinder_database,
                                                                      pid_threshold, plength_threshold, report_all,
                                                                      output_dir=self._output_dir,
-                                                                     genes_to_exclude=self._genes_to_exclude)
+                                                                     genes_to_exclude=self._genes_to_exclude,
+                                                                     nprocs=self._nprocs)
         return pointfinder_parser.parse_results()
 
     def _create_plasmidfinder_dataframe(self, plasmidfinder_blast_map, pid_threshold, plength_threshold, report_all):
@@ -61,7 +64,8 @@ class AMRDetectionResistance(AMRDetection):
                                                                          pid_threshold,
                                                                          plength_threshold, report_all,
                                                                          output_dir=self._output_dir,
-                                                                         genes_to_exclude=self._genes_to_exclude)
+                                                                         genes_to_exclude=self._genes_to_exclude,
+                                                                         nprocs=self._nprocs)
         return plasmidfinder_parser.parse_results()
 
     def _create_amr_summary(self, files, resfinder_dataframe, quality_module_dataframe,pointfinder_dataframe, plasmidfinder_dataframe, mlst_dataframe):
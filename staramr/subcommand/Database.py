@@ -8,9 +8,7 @@ from os import path, mkdir
 
 from staramr.SubCommand import SubCommand
 from staramr.Utils import get_string_with_spacing
-from staramr.blast.JobHandler import JobHandler
 from staramr.databases.AMRDatabasesManager import AMRDatabasesManager
-from staramr.databases.resistance.ARGDrugTable import ARGDrugTable
 from staramr.exceptions.CommandParseException import CommandParseException
 from staramr.exceptions.DatabaseErrorException import DatabaseErrorException
 from staramr.exceptions.DatabaseNotFoundException import DatabaseNotFoundException
@@ -284,6 +282,9 @@ class Info(Database):
     def run(self, args):
         super(Info, self).run(args)
 
+        from staramr.blast.JobHandler import JobHandler
+        from staramr.databases.resistance.ARGDrugTable import ARGDrugTable
+
         arg_drug_table = ARGDrugTable()
 
         if len(args.directories) == 0:
@@ -2,33 +2,33 @@ import argparse
 import datetime
 import logging
 import multiprocessing
+import os
 import sys
 import tempfile
 from os import path, mkdir
 
-import numpy as np
-import pandas as pd
-
 from staramr.SubCommand import SubCommand
 from staramr.Utils import get_string_with_spacing
-from staramr.blast.JobHandler import JobHandler
 from staramr.blast.plasmidfinder.PlasmidfinderBlastDatabase import PlasmidfinderBlastDatabase
 from staramr.blast.pointfinder.PointfinderBlastDatabase import PointfinderBlastDatabase
 from staramr.databases.AMRDatabasesManager import AMRDatabasesManager
 from staramr.databases.exclude.ExcludeGenesList import ExcludeGenesList
-from staramr.databases.resistance.ARGDrugTable import ARGDrugTable
-from staramr.detection.AMRDetectionFactory import AMRDetectionFactory
 from staramr.exceptions.CommandParseException import CommandParseException
 
 logger = logging.getLogger("Search")
 
 """
 Class for searching for AMR resistance genes.
+
+Modules only needed to perform a search (pandas, BLAST handling, AMR detection) are imported within the methods using
+them, so that argument parsing (e.g., 'staramr search --help') does not pay their import cost.
 """
 
 
 class Search(SubCommand):
     BLANK = '-'
+    TEXT_CHUNK_SIZE = 10000
+    COLUMN_WIDTH_SAMPLE_ROWS = 500
     TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
     def __init__(self, subparser, script_name, version):
@@ -55,7 +55,11 @@ class Search(SubCommand):
                                                 help='Search for AMR genes')
 
         self._default_database_dir = AMRDatabasesManager.get_default_database_directory()
-        cpu_count = multiprocessing.cpu_count()
+        # Use the CPUs this process may run on (e.g. as limited by a scheduler or container), where supported
+        try:
+            cpu_count = len(os.sched_getaffinity(0))
+        except AttributeError:
+            cpu_count = multiprocessing.cpu_count()
 
         arg_parser.add_argument('--pointfinder-organism', action='store', dest='pointfinder_organism', type=str,
                                 help='The organism to use for pointfinder {' + ', '.join(
@@ -170,6 +174,10 @@ class Search(SubCommand):
     def _print_dataframes_to_excel(self, outfile_path, summary_dataframe, resfinder_dataframe, pointfinder_dataframe,
                                    plasmidfinder_dataframe, detailed_summary_dataframe, mlst_dataframe,
                                    settings_dataframe,minimum_contig_length):
+        import pandas as pd
+
+        # xlsxwriter's 'constant_memory' mode is not used: it requires cells to be written row by row, but
+        # pandas writes sheets column by column, so all but the last row of each column would be dropped
         writer = pd.ExcelWriter(outfile_path, engine='xlsxwriter')
 
         sheetname_dataframe = {}
@@ -181,54 +189,72 @@ class Search(SubCommand):
         if pointfinder_dataframe is not None:
             sheetname_dataframe['PointFinder'] = pointfinder_dataframe
 
+        # Columns are resized right after each sheet is written, while its dataframe is at hand
+        wrap_format = writer.book.add_format({'text_wrap': True})
         for name in ['Summary', 'Detailed_Summary', 'ResFinder', 'PointFinder', 'PlasmidFinder', 'MLST_Summary']:
             if name in sheetname_dataframe:
                 if name == 'Summary':
                     sheetname_dataframe[name].to_excel(writer, name, freeze_panes=[1, 2], float_format="%0.2f",na_rep=self.BLANK)
                 else:
                     sheetname_dataframe[name].to_excel(writer, name, freeze_panes=[1, 1], float_format="%0.2f",na_rep=self.BLANK)
-                
-        self._resize_columns(sheetname_dataframe, writer, max_width=50)
+                self._resize_columns(writer.sheets[name], sheetname_dataframe[name], max_width=50,
+                                     wrap_format=wrap_format)
 
         settings_dataframe.to_excel(writer, 'Settings')
-        self._resize_columns({'Settings': settings_dataframe}, writer, max_width=75, text_wrap=False)
+        self._resize_columns(writer.sheets['Settings'], settings_dataframe, max_width=75,
+                             wrap_format=writer.book.add_format({'text_wrap': False}))
 
         writer.save()
 
-    def _resize_columns(self, sheetname_dataframe, writer, max_width, text_wrap=True):
+    def _resize_columns(self, worksheet, dataframe, max_width, wrap_format):
         """
-        Resizes columns in workbook.
-        :param sheetname_dataframe: A map mapping the sheet name to a dataframe.
-        :param writer: The ExcelWriter, which the worksheets already added using writer.to_excel
+        Resizes columns in a worksheet.
+        :param worksheet: The worksheet, which the dataframe was already written to using dataframe.to_excel
+        :param dataframe: The dataframe written to the worksheet.
         :param max_width: The maximum width of the columns.
-        :param text_wrap: Whether or not to turn on text wrapping if columns surpass max_width.
+        :param wrap_format: The cell format to use for columns which surpass max_width.
         :return: None
         """
-        workbook = writer.book
-        wrap_format = workbook.add_format({'text_wrap': text_wrap})
-        for name in sheetname_dataframe:
-            for i, width in enumerate(self._get_col_widths(sheetname_dataframe[name])):
-                if width > max_width:
-                    writer.sheets[name].set_column(i, i, width=max_width, cell_format=wrap_format)
-                else:
-                    writer.sheets[name].set_column(i, i, width=width)
+        for i, width in enumerate(self._get_col_widths(dataframe)):
+            if width > max_width:
+                worksheet.set_column(i, i, width=max_width, cell_format=wrap_format)
+            else:
+                worksheet.set_column(i, i, width=width)
 
     def _get_col_widths(self, df):
         """
-        Calculate column widths based on column headers and contents
+        Calculate column widths based on the index, column headers and contents.
         :param df: The dataframe.
         :return: A generator giving the max width for each column.
         """
-        idx_max = max([len(str(s)) for s in df.index.values] + [len(str(df.index.name))])
+        idx_max = max(self._get_values_width(df.index.to_series()), len(str(df.index.name)))
         yield idx_max
 
         extra = 2
         for c in df.columns:
             # get max length of column contents and length of column header (plus some extra)
-            yield np.max([df[c].astype(str).str.len().max(), len(c)]) + extra
+            yield max([self._get_values_width(df[c]), len(c)]) + extra
+
+    def _get_values_width(self, values):
+        """
+        Calculate the width of a series of values. Numeric widths are taken from the minimum/maximum values and other
+        widths from the first COLUMN_WIDTH_SAMPLE_ROWS values, to avoid converting all values to strings.
+        :param values: The pd.Series of values.
+        :return: The max width of the values.
+        """
+        import pandas as pd
+
+        if values.empty:
+            return 0
+        elif pd.api.types.is_float_dtype(values):
+            return max(len('{:0.2f}'.format(values.max())), len('{:0.2f}'.format(values.min())))
+        elif pd.api.types.is_numeric_dtype(values):
+            return max(len(str(values.max())), len(str(values.min())))
+        else:
+            return values.head(self.COLUMN_WIDTH_SAMPLE_ROWS).astype(str).str.len().max()
 
     def _print_dataframe_to_text_file_handle(self, dataframe, file_handle):
-        dataframe.to_csv(file_handle, sep="\t", float_format="%0.2f", na_rep=self.BLANK)
+        dataframe.to_csv(file_handle, sep="\t", float_format="%0.2f", na_rep=self.BLANK, chunksize=self.TEXT_CHUNK_SIZE)
 
     def _print_settings_to_file(self, settings, file):
         file_handle = open(file, 'w')
@@ -247,7 +273,7 @@ class Search(SubCommand):
         :param resfinder_database: The resfinder database.
         :param pointfinder_database: The pointfinder database.
         :param plasmidfinder_database: The plasmidfinder database.
-        :param nprocs: The number of processing cores to use for BLAST.
+        :param nprocs: The number of processing cores to use for BLAST and for parsing BLAST results.
         :param include_negatives: Whether or not to include negative results in output.
         :param include_resistances: Whether or not to include resistance phenotypes in output.
         :param hits_output: Output directory for hit files.
@@ -263,6 +289,10 @@ class Search(SubCommand):
         :return: A dictionary containing the results as dict['results'] and settings as dict['settings'].
         """
         
+        from staramr.blast.JobHandler import JobHandler
+        from staramr.databases.resistance.ARGDrugTable import ARGDrugTable
+        from staramr.detection.AMRDetectionFactory import AMRDetectionFactory
+
         results = {'results': None, 'settings': None}
 
         with tempfile.TemporaryDirectory() as blast_out:
@@ -279,7 +309,8 @@ class Search(SubCommand):
                                                         include_negatives=include_negatives,
                                                         include_resistances=include_resistances,
                                                         output_dir=hits_output,
-                                                        genes_to_exclude=genes_to_exclude)
+                                                        genes_to_exclude=genes_to_exclude,
+                                                        nprocs=nprocs)
             amr_detection.run_amr_detection(files,pid_threshold, plength_threshold_resfinder,
                                             plength_threshold_pointfinder, plength_threshold_plasmidfinder,genome_size_lower_bound,
                                             genome_size_upper_bound,minimum_N50_value,minimum_contig_length,unacceptable_num_contigs,
@@ -518,6 +549,8 @@ class Search(SubCommand):
             logger.info("--output-dir or --output-settings unset. No settings file will be written")
 
         if output_excel:
+            import pandas as pd
+
             logger.info("Writing Excel to [%s]", output_excel)
             settings_dataframe = pd.DataFrame.from_dict(settings, orient='index')
             settings_dataframe.index.name = 'Key'
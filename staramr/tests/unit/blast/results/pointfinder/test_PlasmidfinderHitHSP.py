@@ -64,3 +64,15 @@ class PlasmidfinderHitHSPTest(unittest.TestCase):
                          'Did not parse correct gene name variant')
         self.assertEqual('IncFII(Serratia)_1_NC_009829', plasmid_hit_hsp.get_amr_gene_variant_accession(),
                          'Did not parse correct gene name variant accession')
+
+    def testGetGenomeIds(self):
+        test_blast_record = {"sstart": 20, "send": 30, "sstrand": "ABC", "qstart": 1, "qend": 10,
+                             'qseqid': 'RepA_1_pKPC-CAV1321_CP011611', 'sseqid': 'contig1'}
+
+        plasmid_hit_hsp = PlasmidfinderHitHSP('test_file.fasta', test_blast_record)
+
+        self.assertEqual('test_file', plasmid_hit_hsp.get_genome_id(), 'Did not parse correct genome id')
+        self.assertEqual('contig1', plasmid_hit_hsp.get_genome_contig_id(), 'Did not parse correct contig id')
+
+        test_blast_record['sseqid'] = 'contig2'
+        self.assertEqual('contig1', plasmid_hit_hsp.get_genome_contig_id(), 'Contig id should only be parsed once')
@@ -22,3 +22,11 @@ class PointfinderHitHSPTest(unittest.TestCase):
         blast_record = pd.Series({'sstart': 1, 'send': 10, 'qstart': 10, 'qend': 1, 'sstrand': 'plus'})
 
         self.assertRaises(InvalidPositionException, PointfinderHitHSP, None, blast_record)
+
+    def testGetHspLengthTotalLength(self):
+        blast_record = pd.Series(
+            {'sstart': 1, 'send': 10, 'qstart': 1, 'qend': 10, 'sstrand': 'plus', 'length': 10, 'qlen': 20})
+
+        hit = PointfinderHitHSP(file=None, blast_record=blast_record)
+
+        self.assertEqual('10/20', hit.get_hsp_length_total_length(), "Should format HSP length/total length")
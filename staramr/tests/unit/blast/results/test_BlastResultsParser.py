@@ -0,0 +1,192 @@
+import re
+import sys
+import tempfile
+import unittest
+from os import getpid, listdir, mkdir, path
+from unittest.mock import MagicMock, patch
+
+from staramr.blast.results.resfinder.BlastResultsParserResfinder import BlastResultsParserResfinder
+
+
+class BlastResultsParserTest(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.test_dir.cleanup()
+
+    def _write_blast_table(self, name, rows):
+        blast_out = path.join(self.test_dir.name, name)
+        with open(blast_out, 'w') as fh:
+            for row in rows:
+                fh.write('\t'.join(str(x) for x in row) + '\n')
+        return blast_out
+
+    def _blast_row(self, gene_id, contig_id, pid, length, contig_start, strand='plus', gene_length=100):
+        contig_end = contig_start + length - 1
+        if strand == 'minus':
+            contig_start, contig_end = contig_end, contig_start
+        seq = 'A' * length
+        return [gene_id, contig_id, pid, length, 1, length, contig_start, contig_end, 10000, gene_length, strand, seq,
+                seq]
+
+    def testParseNAContigId(self):
+        blast_out = self._write_blast_table('file1.tsv', [
+            self._blast_row('blaTEM-1B_1_AY458016', 'NA', 100.0, 100, 1),
+            self._blast_row('blaCTX-M-15_1_AY044436', 'null', 99.0, 100, 1),
+        ])
+        parser = BlastResultsParserResfinder({'file1.fasta': {'beta-lactam': blast_out}}, None, 98.0, 60.0,
+                                             report_all=True)
+
+        results = parser.parse_results()
+
+        self.assertEqual(['NA', 'null'], sorted(results['Contig'].tolist()), 'Did not keep NA-like contig ids')
+        self.assertEqual(['blaCTX-M-15', 'blaTEM-1B'], results['Gene'].tolist(), 'Did not parse correct genes')
+
+    def _write_threshold_blast_table(self):
+        return self._write_blast_table('file1.tsv', [
+            self._blast_row('blaTEM-1B_1_AY458016', 'contig1', 100.0, 100, 1),
+            self._blast_row('blaTEM-1B_1_AY458016', 'contig1', 97.0, 100, 1),
+            self._blast_row('blaCTX-M-15_1_AY044436', 'contig2', 99.0, 50, 1),
+            self._blast_row('blaCTX-M-15_1_AY044436', 'contig2', 99.0, 90, 1, strand='minus'),
+            self._blast_row('aph(6)-Id_1_M28829', 'contig3', 100.0, 100, 1),
+            self._blast_row('blaOXA-1_1_HQ170510', 'contig4', 98.5, 80, 500),
+            self._blast_row('blaOXA-1_1_HQ170510', 'contig4', 99.5, 100, 500),
+        ])
+
+    def testReadBlastTableChunks(self):
+        blast_out = self._write_threshold_blast_table()
+        parser = BlastResultsParserResfinder({}, None, 98.0, 60.0, genes_to_exclude=['aph(6)-Id_1_M28829'])
+        single_table = parser._read_blast_table(blast_out)
+
+        parser.BLAST_CHUNK_SIZE = 2
+        chunked_table = parser._read_blast_table(blast_out)
+
+        self.assertEqual(4, len(single_table.index), 'Wrong number of HSPs passing thresholds')
+        self.assertTrue(single_table.sort_values(by=parser.BLAST_SORT_COLUMNS).reset_index(drop=True).equals(
+            chunked_table.sort_values(by=parser.BLAST_SORT_COLUMNS).reset_index(drop=True)),
+            'Chunked read differs from single read')
+
+    def testReadBlastTableEmpty(self):
+        blast_out = self._write_blast_table('empty.tsv', [])
+        parser = BlastResultsParserResfinder({'file1.fasta': {'beta-lactam': blast_out}}, None, 98.0, 60.0)
+        parser.BLAST_CHUNK_SIZE = 2
+
+        blast_table = parser._read_blast_table(blast_out)
+        results = parser.parse_results()
+
+        self.assertEqual(0, len(blast_table.index), 'Table should be empty')
+        self.assertTrue('plength' in blast_table.columns, 'Empty table should have a plength column')
+        self.assertEqual(0, len(results.index), 'Should be no results')
+
+    def testIterBlastRecordsBatches(self):
+        blast_out = self._write_threshold_blast_table()
+        parser = BlastResultsParserResfinder({'file1.fasta': {'beta-lactam': blast_out}}, None, 98.0, 60.0,
+                                             report_all=True)
+        blast_table = parser._read_blast_table(blast_out).sort_values(by=parser.BLAST_SORT_COLUMNS)
+        single_results = parser.parse_results()
+
+        parser.BLAST_CHUNK_SIZE = 3
+        batched_records = list(parser._iter_blast_records(blast_table))
+        batched_results = parser.parse_results()
+
+        single_records = blast_table.to_dict('records')
+        self.assertEqual(single_records, batched_records, 'Batched records differ from single pass')
+        self.assertEqual([[type(v) for v in r.values()] for r in single_records],
+                         [[type(v) for v in r.values()] for r in batched_records],
+                         'Batched records have different types')
+        self.assertTrue(single_results.equals(batched_results), 'Batched results differ from single pass')
+
+    def testMissingBlastOutput(self):
+        blast_out = self._write_threshold_blast_table()
+        not_a_directory = path.join(blast_out, 'file2.tsv')
+        missing_directory = path.join(self.test_dir.name, 'missing', 'file3.tsv')
+
+        for missing_blast_out in [path.join(self.test_dir.name, 'file2.tsv'), not_a_directory, missing_directory]:
+            parser = BlastResultsParserResfinder({'file1.fasta': {'beta-lactam': blast_out},
+                                                  'file2.fasta': {'beta-lactam': missing_blast_out}}, None, 98.0,
+                                                 60.0)
+            parser._handle_blast_hit = MagicMock()
+
+            with self.assertRaisesRegex(Exception, r'^Blast output \[' + re.escape(missing_blast_out) +
+                                        r'\] does not exist$'):
+                parser.parse_results()
+            parser._handle_blast_hit.assert_not_called()
+
+    def _parse_with_nprocs(self, file_blast_map, nprocs):
+        output_dir = path.join(self.test_dir.name, 'hits_nprocs_' + str(nprocs))
+        mkdir(output_dir)
+        parser = BlastResultsParserResfinder(file_blast_map, None, 98.0, 60.0, output_dir=output_dir, nprocs=nprocs)
+        parser.PARALLEL_MIN_BLAST_BYTES = 0
+        results = parser.parse_results()
+
+        hits = {}
+        for hits_file in listdir(output_dir):
+            with open(path.join(output_dir, hits_file)) as fh:
+                hits[hits_file] = fh.read()
+
+        return results, hits
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'Parallel parsing requires Python 3.7+')
+    def testParseResultsParallelSameAsSerial(self):
+        file_blast_map = {}
+        for i in range(3):
+            file_blast_map['file' + str(i) + '.fasta'] = {
+                'beta-lactam': self._write_blast_table('file' + str(i) + '_beta-lactam.tsv', [
+                    self._blast_row('blaTEM-1B_1_AY458016', 'contig1', 100.0, 100, 1 + i),
+                    self._blast_row('blaTEM-1B_1_AY458016', 'contig2', 99.0, 90, 1, strand='minus'),
+                    self._blast_row('blaCTX-M-15_1_AY044436', 'contig1', 99.5, 100, 1000),
+                ]),
+                'aminoglycoside': self._write_blast_table('file' + str(i) + '_aminoglycoside.tsv', [
+                    self._blast_row('aph(6)-Id_1_M28829', 'contig3', 100.0, 100, 50),
+                ]),
+            }
+
+        serial_results, serial_hits = self._parse_with_nprocs(file_blast_map, 1)
+        with self.assertLogs(level='DEBUG') as parallel_logs:
+            parallel_results, parallel_hits = self._parse_with_nprocs(file_blast_map, 2)
+
+        self.assertEqual(12, len(serial_results.index), 'Wrong number of results')
+        self.assertTrue(serial_results.equals(parallel_results), 'Parallel results differ from serial results')
+        self.assertEqual(3, len(serial_hits), 'Wrong number of hits files')
+        self.assertEqual(serial_hits, parallel_hits, 'Parallel hits files differ from serial hits files')
+        worker_records = [r for r in parallel_logs.records if
+                          r.getMessage().startswith('Parsing BLAST output') and r.process != getpid()]
+        self.assertEqual(6, len(worker_records), 'Did not get log records from worker processes')
+
+    def testParseResultsSerialBeforePython37(self):
+        file_blast_map = {}
+        for i in range(2):
+            file_blast_map['file' + str(i) + '.fasta'] = {
+                'beta-lactam': self._write_blast_table('file' + str(i) + '_beta-lactam.tsv', [
+                    self._blast_row('blaTEM-1B_1_AY458016', 'contig1', 100.0, 100, 1),
+                ]),
+            }
+        parser = BlastResultsParserResfinder(file_blast_map, None, 98.0, 60.0, nprocs=2)
+        parser.PARALLEL_MIN_BLAST_BYTES = 0
+
+        with patch('staramr.blast.results.BlastResultsParser.sys') as mock_sys, patch(
+                'staramr.blast.results.BlastResultsParser.ProcessPoolExecutor') as mock_executor:
+            mock_sys.version_info = (3, 6, 0)
+            results = parser.parse_results()
+
+        mock_executor.assert_not_called()
+        self.assertEqual(2, len(results.index), 'Wrong number of results')
+
+    def testHasMinBlastOutputsSize(self):
+        file_blast_map = {'file1.fasta': {'beta-lactam': 'file1_beta-lactam.tsv', 'colistin': 'file1_colistin.tsv'},
+                          'file2.fasta': {'beta-lactam': 'file2_beta-lactam.tsv', 'colistin': 'file2_colistin.tsv'}}
+        parser = BlastResultsParserResfinder(file_blast_map, None, 98.0, 60.0)
+
+        with patch('staramr.blast.results.BlastResultsParser.os.path.getsize', return_value=100) as mock_getsize:
+            self.assertTrue(parser._has_min_blast_outputs_size(150), 'Should reach minimum size')
+            self.assertEqual(2, mock_getsize.call_count, 'Should stop checking sizes once minimum size is reached')
+
+        with patch('staramr.blast.results.BlastResultsParser.os.path.getsize', return_value=100):
+            self.assertTrue(parser._has_min_blast_outputs_size(400), 'Should reach minimum size')
+            self.assertFalse(parser._has_min_blast_outputs_size(401), 'Should not reach minimum size')
+
+
+if __name__ == '__main__':
+    unittest.main()
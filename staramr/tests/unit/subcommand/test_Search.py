@@ -0,0 +1,48 @@
+import argparse
+import unittest
+
+import pandas as pd
+
+from staramr.subcommand.Search import Search
+
+
+class SearchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.search = Search(argparse.ArgumentParser().add_subparsers(), 'staramr', '0.0')
+        self.search.COLUMN_WIDTH_SAMPLE_ROWS = 2
+
+    def testGetColWidths(self):
+        df = pd.DataFrame({
+            'Isolate ID': ['a', 'isolate_long_name', 'x' * 30],
+            'f': [1.5, -1234.567, 2.0],
+            'i': [5, 123456, 7],
+            'o': ['ab', 'abcd', 'a' * 50],
+            'Long Header': ['a', 'b', 'c'],
+        }).set_index('Isolate ID')
+
+        widths = list(self.search._get_col_widths(df))
+
+        self.assertEqual(17, widths[0], 'Index width should come from the sampled index values')
+        self.assertEqual(10, widths[1], 'Float width should come from the formatted minimum')
+        self.assertEqual(8, widths[2], 'Integer width should come from the maximum')
+        self.assertEqual(6, widths[3], 'Object width should come from the sampled values')
+        self.assertEqual(13, widths[4], 'Width should come from the column header')
+
+    def testGetColWidthsIndexName(self):
+        df = pd.DataFrame({'Isolate ID': ['a', 'b'], 'i': [1, 2]}).set_index('Isolate ID')
+
+        widths = list(self.search._get_col_widths(df))
+
+        self.assertEqual([10, 3], widths, 'Widths should come from the index name and column header')
+
+    def testGetColWidthsEmpty(self):
+        df = pd.DataFrame(columns=['Isolate ID', 'Gene', '%Identity']).set_index('Isolate ID')
+
+        widths = list(self.search._get_col_widths(df))
+
+        self.assertEqual([10, 6, 11], widths, 'Widths of an empty dataframe should come from the headers')
+
+
+if __name__ == '__main__':
+    unittest.main()